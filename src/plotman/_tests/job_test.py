@@ -139,3 +139,34 @@ def test_chia_plots_create_parsing_identifies_errors(arguments):
     )
 
     assert parsed.error is not None
+
+
+class FauxJobWithPhase:
+    # Just enough of a job for the phase grouping helpers.
+
+    def __init__(self, tmpdir, phase):
+        self.tmpdir = tmpdir
+        self.phase = job.Phase.from_tuple(phase)
+
+    def progress(self):
+        return self.phase
+
+
+def test_job_phases_for_tmpdirs_matches_per_dir_scans():
+    tmpdirs = ['/tmp/00', '/tmp/01', '/tmp/02']
+    jobs = [
+        FauxJobWithPhase('/tmp/00', (3, 4)),
+        FauxJobWithPhase('/tmp/00', (1, 2)),
+        FauxJobWithPhase('/tmp/01', (2, 0)),
+        FauxJobWithPhase('/tmp/unconfigured', (4, 0)),
+    ]
+
+    grouped = job.job_phases_for_tmpdirs(tmpdirs, jobs)
+
+    assert grouped == {
+        d: job.job_phases_for_tmpdir(d, jobs)
+        for d in tmpdirs
+    }
+    # Configured but idle dirs get an empty bucket, unconfigured dirs none.
+    assert grouped['/tmp/02'] == []
+    assert '/tmp/unconfigured' not in grouped
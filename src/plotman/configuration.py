@@ -266,6 +266,8 @@ class Plotting:
 @attr.frozen
 class UserInterface:
     use_stty_size: bool = True
+    refresh_interval_s: int = 2
+    max_refresh_interval_s: int = 10
 
 @attr.frozen
 class Interactive:
@@ -3,8 +3,10 @@ import datetime
 import locale
 import math
 import os
+import signal
 import subprocess
 import sys
+import time
 from plotman import archive, configuration, manager, reporting
 from plotman.job import Job
 
@@ -12,6 +14,11 @@ from plotman.job import Job
 class TerminalTooSmallError(Exception):
     pass
 
+# Key bindings, resolved once at import instead of on every keypress.
+_QUIT_KEYS = frozenset({ord('q')})
+_KEY_PLOTTING = ord('p')
+_KEY_ARCHIVING = ord('a')
+
 class Log:
     def __init__(self):
         self.entries = []
@@ -83,14 +90,26 @@ def curses_main(stdscr, cmd_autostart_plotting, cmd_autostart_archiving, cfg):
     plotting_status = '<startup>'    # todo rename these msg?
     archiving_status = '<startup>'
 
-    stdscr.nodelay(True)  # make getch() non-blocking
-    stdscr.timeout(2000)
-
-    # Create windows.  We'll size them in the main loop when we have their content.
-    header_win = curses.newwin(1, 1, 1, 0)
-    log_win = curses.newwin(1, 1, 1, 0)
-    jobs_win = curses.newwin(1, 1, 1, 0)
-    dirs_win = curses.newwin(1, 1, 1, 0)
+    # Block in getch() until a key arrives or the timeout expires.  This is
+    # a kernel-side wait, so an idle screen costs no wakeups between ticks
+    # while keypresses are still handled immediately.  The timeout starts at
+    # the configured refresh interval and backs off while the display is
+    # unchanged; don't let it stretch past the scheduler polling time.
+    refresh_interval_ms = 1000 * cfg.user_interface.refresh_interval_s
+    max_refresh_interval_ms = min(
+        1000 * cfg.user_interface.max_refresh_interval_s,
+        1000 * cfg.scheduling.polling_time_s,
+    )
+    current_interval_ms = refresh_interval_ms
+    last_content_key = None
+    stdscr.timeout(current_interval_ms)
+
+    # Windows are created in the main loop once we have their content, then
+    # retained until the screen geometry changes.  Content is rewritten only
+    # when it differs from what is already displayed, so an idle tick does
+    # no curses work at all.
+    last_geometry = None
+    last_painted = {}
 
     jobs = Job.get_running_jobs(cfg.logging.plots)
     last_refresh = None
@@ -100,6 +119,37 @@ def curses_main(stdscr, cmd_autostart_plotting, cmd_autostart_archiving, cfg):
     archdir_freebytes = None
     aging_reason = None
 
+    # Directory prefixes, for abbreviation.  The configured directories do
+    # not change while we run, so compute these once rather than every tick.
+    tmp_prefix = os.path.commonpath(cfg.directories.tmp)
+    dst_dir = cfg.directories.get_dst_directories()
+    dst_prefix = os.path.commonpath(dst_dir)
+    n_tmpdirs = len(cfg.directories.tmp)
+    arch_prefix = ''
+
+    # Terminal size, probed on the first tick and again after a resize.
+    # Probing on every tick is wasteful, and in the stty configuration it
+    # costs a subprocess spawn per tick.  Invalidation hooks SIGWINCH
+    # directly, since use_stty_size exists precisely because curses'
+    # SIGWINCH machinery is unreliable on some systems.  Installing our
+    # handler replaces the one ncurses set up at initscr (so KEY_RESIZE is
+    # never delivered), which is fine because both probe strategies below
+    # ask the kernel rather than curses for the size.
+    term_size = None
+
+    if hasattr(signal, 'SIGWINCH'):
+        def handle_sigwinch(signum, frame):
+            nonlocal term_size
+            term_size = None
+        signal.signal(signal.SIGWINCH, handle_sigwinch)
+
+    # Rendered report cache, as (key, rendered text) pairs.  Building these
+    # tables is most of the per-tick work and their inputs rarely change
+    # between refreshes, so reuse the previous rendering when they do not.
+    tmp_report_cache = (None, None)
+    dst_report_cache = (None, None)
+    arch_report_cache = (None, None)
+
     while True:
 
         # A full refresh scans for and reads info for running jobs from
@@ -114,7 +164,12 @@ def curses_main(stdscr, cmd_autostart_plotting, cmd_autostart_archiving, cfg):
             do_full_refresh = elapsed >= cfg.scheduling.polling_time_s
 
         if not do_full_refresh:
-            jobs = Job.get_running_jobs(cfg.logging.plots, cached_jobs=jobs)
+            # Between full refreshes, only prune jobs whose processes have
+            # exited.  Rescanning the whole process table costs a /proc read
+            # for every process on the system each tick, while pruning only
+            # touches our own jobs.  New jobs are picked up on the next full
+            # refresh (or immediately when we start one ourselves below).
+            jobs = [j for j in jobs if j.proc.is_running()]
 
         else:
             last_refresh = datetime.datetime.now()
@@ -122,7 +177,8 @@ def curses_main(stdscr, cmd_autostart_plotting, cmd_autostart_archiving, cfg):
 
             if plotting_active:
                 (started, msg) = manager.maybe_start_new_plot(
-                    cfg.directories, cfg.scheduling, cfg.plotting, cfg.logging
+                    cfg.directories, cfg.scheduling, cfg.plotting, cfg.logging,
+                    jobs=jobs,
                 )
                 if (started):
                     if aging_reason is not None:
@@ -147,56 +203,66 @@ def curses_main(stdscr, cmd_autostart_plotting, cmd_autostart_archiving, cfg):
                 for log_message in log_messages:
                     log.log(log_message)
 
+                # The archive prefix only changes when the free space data
+                # does, so recompute it here rather than every tick.
+                archive_directories = archdir_freebytes.keys()
+                if len(archive_directories) == 0:
+                    arch_prefix = ''
+                else:
+                    arch_prefix = os.path.commonpath(archive_directories)
+
 
-        # Get terminal size.  Recommended method is stdscr.getmaxyx(), but this
-        # does not seem to work on some systems.  It may be a bug in Python
-        # curses, maybe having to do with registering sigwinch handlers in
-        # multithreaded environments.  See e.g.
-        #     https://stackoverflow.com/questions/33906183#33906270
-        # Alternative option is to call out to `stty size`.  For now, we
-        # support both strategies, selected by a config option.
-        # TODO: also try shutil.get_terminal_size()
+        # Get terminal size.  stdscr.getmaxyx() only reflects resizes when
+        # curses' own SIGWINCH handling works, which it does not on some
+        # systems (see https://stackoverflow.com/questions/33906183#33906270)
+        # and which our SIGWINCH handler above replaces anyway.  So ask the
+        # kernel directly: via the TIOCGWINSZ ioctl, or by calling out to
+        # `stty size` for systems where even that misbehaves, selected by a
+        # config option.
         n_rows: int
         n_cols: int
-        if cfg.user_interface.use_stty_size:
-            completed_process = subprocess.run(
-                ['stty', 'size'], check=True, encoding='utf-8', stdout=subprocess.PIPE
-            )
-            elements = completed_process.stdout.split()
-            (n_rows, n_cols) = [int(v) for v in elements]
-        else:
-            (n_rows, n_cols) = map(int, stdscr.getmaxyx())
-
-        stdscr.clear()
-        stdscr.resize(n_rows, n_cols)
-        curses.resize_term(n_rows, n_cols)
+        if term_size is None:
+            if cfg.user_interface.use_stty_size:
+                completed_process = subprocess.run(
+                    ['stty', 'size'], check=True, encoding='utf-8', stdout=subprocess.PIPE
+                )
+                elements = completed_process.stdout.split()
+                term_size = tuple(int(v) for v in elements)
+            else:
+                size = os.get_terminal_size(sys.stdout.fileno())
+                term_size = (size.lines, size.columns)
+        (n_rows, n_cols) = term_size
 
         #
         # Obtain and measure content
         #
 
-        # Directory prefixes, for abbreviation
-        tmp_prefix = os.path.commonpath(cfg.directories.tmp)
-        dst_dir = cfg.directories.get_dst_directories()
-        dst_prefix = os.path.commonpath(dst_dir)
-        if archiving_configured:
-            archive_directories = archdir_freebytes.keys()
-            if len(archive_directories) == 0:
-                arch_prefix = ''
-            else:
-                arch_prefix = os.path.commonpath(archive_directories)
-
-        n_tmpdirs = len(cfg.directories.tmp)
-
         # Directory reports.
-        tmp_report = reporting.tmp_dir_report(
-            jobs, cfg.directories, cfg.scheduling, n_cols, 0, n_tmpdirs, tmp_prefix)
-        dst_report = reporting.dst_dir_report(
-            jobs, dst_dir, n_cols, dst_prefix)
+        tmp_key = (tuple(sorted((j.tmpdir, j.progress()) for j in jobs)),
+                n_cols, tmp_prefix)
+        if tmp_report_cache[0] != tmp_key:
+            tmp_report_cache = (tmp_key, reporting.tmp_dir_report(
+                jobs, cfg.directories, cfg.scheduling, n_cols, 0, n_tmpdirs, tmp_prefix))
+        tmp_report = tmp_report_cache[1]
+
+        # The dst report also reflects the destination filesystems, so force
+        # a rebuild on full refreshes to pick up newly landed plots.
+        dst_key = (tuple(sorted((j.dstdir, j.progress()) for j in jobs)),
+                n_cols, dst_prefix)
+        if do_full_refresh or dst_report_cache[0] != dst_key:
+            dst_report_cache = (dst_key, reporting.dst_dir_report(
+                jobs, dst_dir, n_cols, dst_prefix))
+        dst_report = dst_report_cache[1]
+
         if archiving_configured:
-            arch_report = reporting.arch_dir_report(archdir_freebytes, n_cols, arch_prefix)
-            if not arch_report:
-                arch_report = '<no archive dir info>'
+            arch_key = (tuple(sorted(archdir_freebytes.items())),
+                    n_cols, arch_prefix)
+            if arch_report_cache[0] != arch_key:
+                arch_report = reporting.arch_dir_report(archdir_freebytes, n_cols, arch_prefix)
+                if not arch_report:
+                    arch_report = '<no archive dir info>'
+                arch_report_cache = (arch_key, arch_report)
+            arch_report = arch_report_cache[1]
         else:
             arch_report = '<archiving not configured>'
 
@@ -219,126 +285,243 @@ def curses_main(stdscr, cmd_autostart_plotting, cmd_autostart_archiving, cfg):
 
         header_pos = 0
         jobs_pos = header_pos + header_h
-        stdscr.resize(n_rows, n_cols)
         dirs_pos = jobs_pos + jobs_h
         logscreen_pos = dirs_pos + dirs_h
 
         linecap = n_cols - 1
         logs_h = n_rows - (header_h + jobs_h + dirs_h)
 
-        try:
-            header_win = curses.newwin(header_h, n_cols, header_pos, 0)
-            log_win = curses.newwin(logs_h, n_cols, logscreen_pos, 0)
-            jobs_win = curses.newwin(jobs_h, n_cols, jobs_pos, 0)
-            dirs_win = curses.newwin(dirs_h, n_cols, dirs_pos, 0)
-        except Exception:
-            raise Exception('Failed to initialize curses windows, try a larger '
-                            'terminal window.')
+        tmpwin_dstwin_gutter = 6
+        maxtd_h = max([tmp_h, dst_h])
+
+        jobs_report = reporting.status_report(jobs, n_cols, jobs_h,
+            tmp_prefix, dst_prefix)
+
+        # Back off the refresh rate while the display content is unchanged
+        # (an idle screen), and snap back to the configured interval as soon
+        # as anything changes.  The header clock is deliberately excluded.
+        content_key = (jobs_report, tmp_report, dst_report, arch_report,
+                plotting_active, plotting_status,
+                archiving_active, archiving_status,
+                log.get_cur_pos())
+        if content_key == last_content_key:
+            current_interval_ms = min(
+                current_interval_ms * 2, max_refresh_interval_ms)
+        else:
+            current_interval_ms = refresh_interval_ms
+            last_content_key = content_key
+        stdscr.timeout(current_interval_ms)
+
+        # (Re)create the windows only when the screen geometry has changed.
+        # A geometry change invalidates everything painted so far.
+        geometry = (n_rows, n_cols, tmp_h, tmp_w, dst_h, dst_w, arch_h)
+        if geometry != last_geometry:
+            last_geometry = geometry
+            last_painted = {}
+
+            stdscr.clear()
+            stdscr.resize(n_rows, n_cols)
+            curses.resize_term(n_rows, n_cols)
+            stdscr.noutrefresh()
+
+            try:
+                header_win = curses.newwin(header_h, n_cols, header_pos, 0)
+                jobs_win = curses.newwin(jobs_h, n_cols, jobs_pos, 0)
+                tmpwin = curses.newwin(
+                            tmp_h, tmp_w,
+                            dirs_pos + int(maxtd_h - tmp_h), 0)
+                dstwin = curses.newwin(
+                        dst_h, dst_w,
+                        dirs_pos + int((maxtd_h - dst_h) / 2), tmp_w + tmpwin_dstwin_gutter)
+                archwin = curses.newwin(arch_h, arch_w, dirs_pos + maxtd_h, 0)
+                log_win = curses.newwin(logs_h, n_cols, logscreen_pos, 0)
+            except Exception:
+                raise Exception('Failed to initialize curses windows, try a larger '
+                                'terminal window.')
 
         #
-        # Write
+        # Write.  Each window is repainted only if its content changed since
+        # it was last painted; untouched windows keep their display as is.
         #
 
-        # Header
-        header_win.addnstr(0, 0, 'Plotman', linecap, curses.A_BOLD)
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        refresh_msg = "now" if do_full_refresh else f"{int(elapsed)}s/{cfg.scheduling.polling_time_s}"
-        header_win.addnstr(f" {timestamp} (refresh {refresh_msg})", linecap)
-        header_win.addnstr('  |  <P>lotting: ', linecap, curses.A_BOLD)
-        header_win.addnstr(
-                plotting_status_msg(plotting_active, plotting_status), linecap)
-        header_win.addnstr(' <A>rchival: ', linecap, curses.A_BOLD)
-        header_win.addnstr(
-                archiving_status_msg(archiving_configured,
-                    archiving_active, archiving_status), linecap)
-
-        # Oneliner progress display
-        header_win.addnstr(1, 0, 'Jobs (%d): ' % len(jobs), linecap)
-        header_win.addnstr('[' + reporting.job_viz(jobs) + ']', linecap)
-
-        # These are useful for debugging.
-        # header_win.addnstr('  term size: (%d, %d)' % (n_rows, n_cols), linecap)  # Debuggin
-        # if pressed_key:
-            # header_win.addnstr(' (keypress %s)' % str(pressed_key), linecap)
-        header_win.addnstr(2, 0, 'Prefixes:', linecap, curses.A_BOLD)
-        header_win.addnstr('  tmp=', linecap, curses.A_BOLD)
-        header_win.addnstr(tmp_prefix, linecap)
-        header_win.addnstr('  dst=', linecap, curses.A_BOLD)
-        header_win.addnstr(dst_prefix, linecap)
-        if archiving_configured:
-            header_win.addnstr('  archive=', linecap, curses.A_BOLD)
-            header_win.addnstr(arch_prefix, linecap)
-        header_win.addnstr(' (remote)', linecap)
-
+        dirty = False
+
+        # Header.  Quantize the clock and the refresh countdown to 5 second
+        # steps so the guarded repaint below fires a few times a minute
+        # instead of on every tick; nobody needs this line to the second.
+        now = datetime.datetime.now()
+        timestamp = now.replace(second=now.second - now.second % 5).strftime("%H:%M:%S")
+        refresh_msg = "now" if do_full_refresh else f"{int(elapsed) // 5 * 5}s/{cfg.scheduling.polling_time_s}"
+        job_viz = reporting.job_viz(jobs)
+        header_content = (timestamp, refresh_msg, plotting_active,
+                plotting_status, archiving_active, archiving_status,
+                len(jobs), job_viz)
+        if last_painted.get('header') != header_content:
+            last_painted['header'] = header_content
+            header_win.erase()
+            header_win.addnstr(0, 0, 'Plotman', linecap, curses.A_BOLD)
+            header_win.addnstr(f" {timestamp} (refresh {refresh_msg})", linecap)
+            header_win.addnstr('  |  <P>lotting: ', linecap, curses.A_BOLD)
+            header_win.addnstr(
+                    plotting_status_msg(plotting_active, plotting_status), linecap)
+            header_win.addnstr(' <A>rchival: ', linecap, curses.A_BOLD)
+            header_win.addnstr(
+                    archiving_status_msg(archiving_configured,
+                        archiving_active, archiving_status), linecap)
+
+            # Oneliner progress display
+            header_win.addnstr(1, 0, 'Jobs (%d): ' % len(jobs), linecap)
+            header_win.addnstr('[' + job_viz + ']', linecap)
+
+            # These are useful for debugging.
+            # header_win.addnstr('  term size: (%d, %d)' % (n_rows, n_cols), linecap)  # Debuggin
+            # if pressed_key:
+                # header_win.addnstr(' (keypress %s)' % str(pressed_key), linecap)
+            header_win.addnstr(2, 0, 'Prefixes:', linecap, curses.A_BOLD)
+            header_win.addnstr('  tmp=', linecap, curses.A_BOLD)
+            header_win.addnstr(tmp_prefix, linecap)
+            header_win.addnstr('  dst=', linecap, curses.A_BOLD)
+            header_win.addnstr(dst_prefix, linecap)
+            if archiving_configured:
+                header_win.addnstr('  archive=', linecap, curses.A_BOLD)
+                header_win.addnstr(arch_prefix, linecap)
+            header_win.addnstr(' (remote)', linecap)
+            header_win.noutrefresh()
+            dirty = True
 
         # Jobs
-        jobs_win.addstr(0, 0, reporting.status_report(jobs, n_cols, jobs_h,
-            tmp_prefix, dst_prefix))
-        jobs_win.chgat(0, 0, curses.A_REVERSE)
+        if last_painted.get('jobs') != jobs_report:
+            last_painted['jobs'] = jobs_report
+            jobs_win.erase()
+            jobs_win.addstr(0, 0, jobs_report)
+            jobs_win.chgat(0, 0, curses.A_REVERSE)
+            jobs_win.noutrefresh()
+            dirty = True
 
         # Dirs
-        tmpwin_dstwin_gutter = 6
-
-        maxtd_h = max([tmp_h, dst_h])
-
-        tmpwin = curses.newwin(
-                    tmp_h, tmp_w,
-                    dirs_pos + int(maxtd_h - tmp_h), 0)
-        tmpwin.addstr(tmp_report)
-        tmpwin.chgat(0, 0, curses.A_REVERSE)
-
-        dstwin = curses.newwin(
-                dst_h, dst_w,
-                dirs_pos + int((maxtd_h - dst_h) / 2), tmp_w + tmpwin_dstwin_gutter)
-        dstwin.addstr(dst_report)
-        dstwin.chgat(0, 0, curses.A_REVERSE)
-
-        archwin = curses.newwin(arch_h, arch_w, dirs_pos + maxtd_h, 0)
-        archwin.addstr(0, 0, 'Archive dirs free space', curses.A_REVERSE)
-        archwin.addstr(1, 0, arch_report)
+        if last_painted.get('tmp') != tmp_report:
+            last_painted['tmp'] = tmp_report
+            tmpwin.erase()
+            tmpwin.addstr(tmp_report)
+            tmpwin.chgat(0, 0, curses.A_REVERSE)
+            tmpwin.noutrefresh()
+            dirty = True
+
+        if last_painted.get('dst') != dst_report:
+            last_painted['dst'] = dst_report
+            dstwin.erase()
+            dstwin.addstr(dst_report)
+            dstwin.chgat(0, 0, curses.A_REVERSE)
+            dstwin.noutrefresh()
+            dirty = True
+
+        if last_painted.get('arch') != arch_report:
+            last_painted['arch'] = arch_report
+            archwin.erase()
+            archwin.addstr(0, 0, 'Archive dirs free space', curses.A_REVERSE)
+            archwin.addstr(1, 0, arch_report)
+            archwin.noutrefresh()
+            dirty = True
 
         # Log.  Could use a pad here instead of managing scrolling ourselves, but
         # this seems easier.
-        log_win.addnstr(0, 0, ('Log: %d (<up>/<down>/<end> to scroll)\n' % log.get_cur_pos() ),
-                linecap, curses.A_REVERSE)
-        for i, logline in enumerate(log.cur_slice(logs_h - 1)):
-            log_win.addnstr(i + 1, 0, logline, linecap)
-
-        stdscr.noutrefresh()
-        header_win.noutrefresh()
-        jobs_win.noutrefresh()
-        tmpwin.noutrefresh()
-        dstwin.noutrefresh()
-        archwin.noutrefresh()
-        log_win.noutrefresh()
-        curses.doupdate()
+        log_lines = log.cur_slice(logs_h - 1)
+        log_content = (log.get_cur_pos(), tuple(log_lines))
+        if last_painted.get('log') != log_content:
+            last_painted['log'] = log_content
+            log_win.erase()
+            log_win.addnstr(0, 0, ('Log: %d (<up>/<down>/<end> to scroll)\n' % log.get_cur_pos() ),
+                    linecap, curses.A_REVERSE)
+            for i, logline in enumerate(log_lines):
+                log_win.addnstr(i + 1, 0, logline, linecap)
+            log_win.noutrefresh()
+            dirty = True
+
+        if dirty:
+            curses.doupdate()
 
         try:
             key = stdscr.getch()
         except KeyboardInterrupt:
             key = ord('q')
 
-        if key == curses.KEY_UP:
-            log.shift_slice(-1)
-            pressed_key = 'up'
-        elif key == curses.KEY_DOWN:
-            log.shift_slice(1)
-            pressed_key = 'dwn'
-        elif key == curses.KEY_END:
-            log.shift_slice_to_end()
-            pressed_key = 'end'
-        elif key == ord('p'):
-            plotting_active = not plotting_active
-            pressed_key = 'p'
-        elif key == ord('a'):
-            archiving_active = not archiving_active
-            pressed_key = 'a'
-        elif key == ord('q'):
+        if key != -1:
+            # Any keypress snaps the refresh rate back to the configured
+            # interval so the response to it is rendered promptly.
+            current_interval_ms = refresh_interval_ms
+
+        # Handle the key, then drain any further queued keypresses (e.g. a
+        # held-down scroll key) with non-blocking reads before re-rendering,
+        # so a burst of input costs one redraw instead of one tick per key.
+        quit_requested = False
+        while key != -1:
+            if key in _QUIT_KEYS:
+                quit_requested = True
+                break
+            elif key == curses.KEY_UP:
+                log.shift_slice(-1)
+                pressed_key = 'up'
+            elif key == curses.KEY_DOWN:
+                log.shift_slice(1)
+                pressed_key = 'dwn'
+            elif key == curses.KEY_END:
+                log.shift_slice_to_end()
+                pressed_key = 'end'
+            elif key == _KEY_PLOTTING:
+                plotting_active = not plotting_active
+                pressed_key = 'p'
+            elif key == _KEY_ARCHIVING:
+                archiving_active = not archiving_active
+                pressed_key = 'a'
+            else:
+                pressed_key = key
+
+            stdscr.timeout(0)
+            try:
+                key = stdscr.getch()
+            except KeyboardInterrupt:
+                key = ord('q')
+
+        stdscr.timeout(current_interval_ms)
+
+        if quit_requested:
             break
-        else:
-            pressed_key = key
+
+# Seconds between reports when stdout is not a terminal.  There is nobody
+# watching in real time, so refresh far less often than the curses screen.
+_NONINTERACTIVE_REFRESH_S = 30
+
+def run_noninteractive(cfg):
+    '''Periodically print plain text status reports.  Used when stdout is
+       not a terminal (e.g. piped to a file or another program), where the
+       curses interface cannot run and ANSI rendering would be wasted.
+       Toggling plotting/archiving still requires a terminal.'''
+    print('stdout is not a terminal; printing plain status reports '
+          '(plotting/archiving control is unavailable)')
+
+    tmp_prefix = os.path.commonpath(cfg.directories.tmp)
+    dst_prefix = os.path.commonpath(cfg.directories.get_dst_directories())
+
+    try:
+        while True:
+            # Scan from scratch each interval: cached jobs never re-read
+            # their logfiles, which would freeze the reported phases.  At
+            # this cadence a full scan is cheap.
+            jobs = Job.get_running_jobs(cfg.logging.plots)
+            timestamp = datetime.datetime.now().strftime('%m-%d %H:%M:%S')
+            print('%s: %d jobs' % (timestamp, len(jobs)))
+            print(reporting.status_report(
+                jobs, 120, tmp_prefix=tmp_prefix, dst_prefix=dst_prefix))
+            print('', flush=True)
+            time.sleep(_NONINTERACTIVE_REFRESH_S)
+    except KeyboardInterrupt:
+        return
 
 def run_interactive(cfg, autostart_plotting=None, autostart_archiving=None):
+    if not sys.stdout.isatty():
+        run_noninteractive(cfg)
+        return
+
     locale.setlocale(locale.LC_ALL, '')
     code = locale.getpreferredencoding()
     # Then use code as the encoding for str.encode() calls.
@@ -1,5 +1,6 @@
 # TODO do we use all these?
 import argparse
+import concurrent.futures
 import contextlib
 import functools
 import logging
@@ -22,11 +23,24 @@ from plotman import chia
 
 def job_phases_for_tmpdir(d, all_jobs):
     '''Return phase 2-tuples for jobs running on tmpdir d'''
-    return sorted([j.progress() for j in all_jobs if j.tmpdir == d])
+    return sorted([j.progress() for j in all_jobs if j.tmpdir == d],
+            key=Phase.sort_key)
+
+def job_phases_for_tmpdirs(tmpdirs, all_jobs):
+    '''Return a map from each of tmpdirs to its sorted phase 2-tuples,
+       grouping all jobs in a single pass rather than one scan per dir'''
+    phases = {d: [] for d in tmpdirs}
+    for j in all_jobs:
+        if j.tmpdir in phases:
+            phases[j.tmpdir].append(j.progress())
+    for d_phases in phases.values():
+        d_phases.sort(key=Phase.sort_key)
+    return phases
 
 def job_phases_for_dstdir(d, all_jobs):
     '''Return phase 2-tuples for jobs outputting to dstdir d'''
-    return sorted([j.progress() for j in all_jobs if j.dstdir == d])
+    return sorted([j.progress() for j in all_jobs if j.dstdir == d],
+            key=Phase.sort_key)
 
 def is_plotting_cmdline(cmdline):
     if cmdline and 'python' in cmdline[0].lower():
@@ -89,6 +103,30 @@ class ParsedChiaPlotsCreateCommand:
         self.help = help
         self.parameters = parameters
 
+def _initialize_job(proc, logroot):
+    '''Build a Job for a plot process, or None if it should be skipped.
+       Runs on a worker thread; must not share psutil oneshot state.'''
+    with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied):
+        with proc.oneshot():
+            command_line = list(proc.cmdline())
+            if len(command_line) == 0:
+                # https://github.com/ericaltendorf/plotman/issues/610
+                return None
+            parsed_command = parse_chia_plots_create_command_line(
+                command_line=command_line,
+            )
+            if parsed_command.error is not None:
+                return None
+            job = Job(
+                proc=proc,
+                parsed_command=parsed_command,
+                logroot=logroot,
+            )
+            if job.help:
+                return None
+            return job
+    return None
+
 @functools.total_ordering
 @attr.frozen(order=False)
 class Phase:
@@ -97,10 +135,12 @@ class Phase:
     known: bool = True
 
     def __lt__(self, other):
-        return (
-            (not self.known, self.major, self.minor)
-            < (not other.known, other.major, other.minor)
-        )
+        return self.sort_key() < other.sort_key()
+
+    def sort_key(self):
+        '''Ordering tuple; pass as a sorted() key to build it once per
+           element instead of twice per comparison.'''
+        return (not self.known, self.major, self.minor)
 
     @classmethod
     def from_tuple(cls, t):
@@ -136,6 +176,7 @@ class Job:
            new jobs not already in the cache.'''
         jobs = []
         cached_jobs_by_pid = { j.proc.pid: j for j in cached_jobs }
+        new_processes = []
 
         with contextlib.ExitStack() as exit_stack:
             processes = []
@@ -169,28 +210,24 @@ class Job:
             ]
 
             for proc in wanted_processes:
-                with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied):
-                    if proc.pid in cached_jobs_by_pid.keys():
-                        jobs.append(cached_jobs_by_pid[proc.pid])  # Copy from cache
-                    else:
-                        with proc.oneshot():
-                            command_line = list(proc.cmdline())
-                            if len(command_line) == 0:
-                                # https://github.com/ericaltendorf/plotman/issues/610
-                                continue
-                            parsed_command = parse_chia_plots_create_command_line(
-                                command_line=command_line,
-                            )
-                            if parsed_command.error is not None:
-                                continue
-                            job = Job(
-                                proc=proc,
-                                parsed_command=parsed_command,
-                                logroot=logroot,
-                            )
-                            if job.help:
-                                continue
-                            jobs.append(job)
+                if proc.pid in cached_jobs_by_pid:
+                    jobs.append(cached_jobs_by_pid[proc.pid])  # Copy from cache
+                else:
+                    new_processes.append(proc)
+
+        # Deliberately outside the ExitStack: the worker threads take each
+        # process's oneshot lock, which the stack would still be holding.
+        if new_processes:
+            # Initializing a job reads the process's cwd, open files, and
+            # logfile, retrying with sleeps of up to a few seconds while the
+            # plotter starts up.  Initialize concurrently so those waits
+            # overlap instead of accumulating per new job.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                initialized = list(executor.map(
+                    functools.partial(_initialize_job, logroot=logroot),
+                    new_processes,
+                ))
+            jobs.extend(job for job in initialized if job is not None)
 
         return jobs
 
@@ -200,6 +237,8 @@ class Job:
         self.proc = proc
         # These are dynamic, cached, and need to be udpated periodically
         self.phase = Phase(known=False)
+        # (tmpdir mtime, matching temp file paths) from the last scan
+        self._tmp_files_cache = (None, [])
 
         self.help = parsed_command.help
         self.args = parsed_command.parameters
@@ -385,12 +424,24 @@ class Job:
         total_bytes = 0
         with contextlib.suppress(FileNotFoundError):
             # The directory might not exist at this name, or at all, anymore
-            with os.scandir(self.tmpdir) as it:
-                for entry in it:
-                    if self.plot_id in entry.name:
-                        with contextlib.suppress(FileNotFoundError):
-                            # The file might disappear; this being an estimate we don't care
-                            total_bytes += entry.stat().st_size
+            mtime = os.stat(self.tmpdir).st_mtime_ns
+            cached_mtime, tmp_files = self._tmp_files_cache
+            if mtime != cached_mtime:
+                # The set of entries only changes when files are created,
+                # deleted, or renamed, all of which bump the directory mtime.
+                # Cache the matching names so that an unchanged directory
+                # costs one stat per temp file instead of a full scan of a
+                # directory shared with every other job plotting to it.
+                tmp_files = []
+                with os.scandir(self.tmpdir) as it:
+                    for entry in it:
+                        if self.plot_id in entry.name:
+                            tmp_files.append(entry.path)
+                self._tmp_files_cache = (mtime, tmp_files)
+            for path in tmp_files:
+                with contextlib.suppress(FileNotFoundError):
+                    # The file might disappear; this being an estimate we don't care
+                    total_bytes += os.stat(path).st_size
         return total_bytes
 
     def get_run_status(self):
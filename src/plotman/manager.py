@@ -1,3 +1,4 @@
+import functools
 import logging
 import operator
 import os
@@ -29,7 +30,7 @@ def dstdirs_to_furthest_phase(all_jobs):
        that is emitting to that dst dir.'''
     result = {}
     for j in all_jobs:
-        if not j.dstdir in result.keys() or result[j.dstdir] < j.progress():
+        if j.dstdir not in result or result[j.dstdir] < j.progress():
             result[j.dstdir] = j.progress()
     return result
 
@@ -40,13 +41,26 @@ def dstdirs_to_youngest_phase(all_jobs):
     for j in all_jobs:
         if j.dstdir is None:
             continue
-        if not j.dstdir in result.keys() or result[j.dstdir] > j.progress():
+        if j.dstdir not in result or result[j.dstdir] > j.progress():
             result[j.dstdir] = j.progress()
     return result
 
 def phases_permit_new_job(phases, d, sched_cfg, dir_cfg):
     '''Scheduling logic: return True if it's OK to start a new job on a tmp dir
        with existing jobs in the provided phases.'''
+    # Limit the total number of jobs per tmp dir. Default to the overall max
+    # jobs configuration, but restrict to any configured overrides.
+    max_jobs_override = None
+    if dir_cfg.tmp_overrides is not None and d in dir_cfg.tmp_overrides:
+        max_jobs_override = dir_cfg.tmp_overrides[d].tmpdir_max_jobs
+
+    return _phases_permit_new_job(tuple(phases), sched_cfg, max_jobs_override)
+
+# The same phase lists come back tick after tick for idle tmp dirs, so the
+# verdict is memoized on the (hashable) inputs.  dir_cfg is unhashable and
+# only contributes the per-dir max jobs override, which is passed instead.
+@functools.lru_cache(maxsize=256)
+def _phases_permit_new_job(phases, sched_cfg, max_jobs_override):
     # Filter unknown-phase jobs
     phases = [ph for ph in phases if ph.known]
 
@@ -61,20 +75,19 @@ def phases_permit_new_job(phases, d, sched_cfg, dir_cfg):
     if len([p for p in phases if p < milestone]) >= sched_cfg.tmpdir_stagger_phase_limit:
         return False
 
-    # Limit the total number of jobs per tmp dir. Default to the overall max
-    # jobs configuration, but restrict to any configured overrides.
     max_plots = sched_cfg.tmpdir_max_jobs
-    if dir_cfg.tmp_overrides is not None and d in dir_cfg.tmp_overrides:
-        curr_overrides = dir_cfg.tmp_overrides[d]
-        if curr_overrides.tmpdir_max_jobs is not None:
-            max_plots = curr_overrides.tmpdir_max_jobs
+    if max_jobs_override is not None:
+        max_plots = max_jobs_override
     if len(phases) >= max_plots:
         return False
 
     return True
 
-def maybe_start_new_plot(dir_cfg, sched_cfg, plotting_cfg, log_cfg):
-    jobs = job.Job.get_running_jobs(log_cfg.plots)
+def maybe_start_new_plot(dir_cfg, sched_cfg, plotting_cfg, log_cfg, jobs=None):
+    '''jobs, if provided, is a freshly scanned job list to reuse; otherwise
+       the process table is scanned here.'''
+    if jobs is None:
+        jobs = job.Job.get_running_jobs(log_cfg.plots)
 
     wait_reason = None  # If we don't start a job this iteration, this says why.
 
@@ -85,7 +98,7 @@ def maybe_start_new_plot(dir_cfg, sched_cfg, plotting_cfg, log_cfg):
     elif len(jobs) >= sched_cfg.global_max_jobs:
         wait_reason = 'max jobs (%d) - (%ds/%ds)' % (sched_cfg.global_max_jobs, youngest_job_age, global_stagger)
     else:
-        tmp_to_all_phases = [(d, job.job_phases_for_tmpdir(d, jobs)) for d in dir_cfg.tmp]
+        tmp_to_all_phases = job.job_phases_for_tmpdirs(dir_cfg.tmp, jobs).items()
         eligible = [ (d, phases) for (d, phases) in tmp_to_all_phases
                 if phases_permit_new_job(phases, d, sched_cfg, dir_cfg) ]
         rankable = [ (d, phases[0]) if phases else (d, job.Phase(known=False))
@@ -106,7 +119,7 @@ def maybe_start_new_plot(dir_cfg, sched_cfg, plotting_cfg, log_cfg):
                 dst_dirs = dir_cfg.get_dst_directories()
                 dir2ph = { d:ph for (d, ph) in dstdirs_to_youngest_phase(jobs).items()
                         if d in dst_dirs and ph is not None}
-                unused_dirs = [d for d in dst_dirs if d not in dir2ph.keys()]
+                unused_dirs = [d for d in dst_dirs if d not in dir2ph]
                 dstdir = ''
                 if unused_dirs:
                     dstdir = random.choice(unused_dirs)
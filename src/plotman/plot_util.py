@@ -1,3 +1,4 @@
+import functools
 import math
 import os
 import re
@@ -17,6 +18,9 @@ def get_k32_plotsize():
 def get_plotsize(k):
     return (int)(_get_plotsize_scaler(k) * k * pow(2, k))
 
+# The same values come through here for every row on every status render,
+# so the formatted strings are memoized.
+@functools.lru_cache(maxsize=4096)
 def human_format(num, precision, powerOfTwo=False):
     divisor = 1024 if powerOfTwo else 1000
     
@@ -32,6 +36,7 @@ def human_format(num, precision, powerOfTwo=False):
     
     return result
 
+@functools.lru_cache(maxsize=4096)
 def time_format(sec):
     if sec is None:
         return '-'
@@ -1,13 +1,16 @@
+import functools
 import math
 import os
 
 import psutil
 import texttable as tt  # from somewhere?
+from collections import Counter
 from itertools import groupby
 
 from plotman import archive, job, manager, plot_util
 
 
+@functools.lru_cache(maxsize=1024)
 def abbr_path(path, putative_prefix):
     if putative_prefix and path.startswith(putative_prefix):
         return os.path.relpath(path, putative_prefix)
@@ -33,35 +36,59 @@ def phases_str(phases, max_num=None):
         last = ' '.join([phase_str(pair) for pair in phases[n_first + n_elided:]])
         return first + elided + last
 
-def n_at_ph(jobs, ph):
-    return sum([1 for j in jobs if j.progress() == ph])
+_N_TO_CHAR_MAP = dict(enumerate(" .:;!"))
 
 def n_to_char(n):
-    n_to_char_map = dict(enumerate(" .:;!"))
-
     if n < 0:
         return 'X'  # Should never be negative
-    elif n >= len(n_to_char_map):
-        n = len(n_to_char_map) - 1
+    elif n >= len(_N_TO_CHAR_MAP):
+        n = len(_N_TO_CHAR_MAP) - 1
 
-    return n_to_char_map[n]
+    return _N_TO_CHAR_MAP[n]
 
 def job_viz(jobs):
     # TODO: Rewrite this in a way that ensures we count every job
     # even if the reported phases don't line up with expectations.
-    result = ''
-    result += '1'
+    counts = Counter(j.progress() for j in jobs)
+    result = ['1']
     for i in range(0, 8):
-        result += n_to_char(n_at_ph(jobs, job.Phase(1, i)))
-    result += '2'
+        result.append(n_to_char(counts[job.Phase(1, i)]))
+    result.append('2')
     for i in range(0, 8):
-        result += n_to_char(n_at_ph(jobs, job.Phase(2, i)))
-    result += '3'
+        result.append(n_to_char(counts[job.Phase(2, i)]))
+    result.append('3')
     for i in range(0, 7):
-        result += n_to_char(n_at_ph(jobs, job.Phase(3, i)))
-    result += '4'
-    result += n_to_char(n_at_ph(jobs, job.Phase(4, 0)))
-    return result
+        result.append(n_to_char(counts[job.Phase(3, i)]))
+    result.append('4')
+    result.append(n_to_char(counts[job.Phase(4, 0)]))
+    return ''.join(result)
+
+# Recycled Texttable instances, keyed per report layout.  reset() drops the
+# header and rows but keeps the column configuration, so reusing an instance
+# skips reallocating and reconfiguring the table on every render.
+_recycled_tables = {}
+
+def _recycled_table(key):
+    '''Return (table, created) for the report layout identified by key'''
+    tab = _recycled_tables.get(key)
+    if tab is None:
+        tab = tt.Texttable()
+        _recycled_tables[key] = tab
+        return (tab, True)
+    tab.reset()
+    # draw() caches computed column widths in _width and reset() does not
+    # clear it, which would lock the table to its first render's widths.
+    try:
+        del tab._width
+    except AttributeError:
+        pass
+    return (tab, False)
+
+# Table headings, built once instead of on every render.
+_STATUS_REPORT_HEADINGS = ['plot id', 'k', 'tmp', 'dst', 'wall', 'phase', 'tmp',
+        'pid', 'stat', 'mem', 'user', 'sys', 'io']
+_TMP_DIR_HEADINGS = ['tmp', 'ready', 'phases']
+_DST_DIR_HEADINGS = ['dst', 'plots', 'GBfree', 'inbnd phases', 'pri']
 
 # Command: plotman status
 # Shows a general overview of all running jobs
@@ -79,15 +106,16 @@ def status_report(jobs, width, height=None, tmp_prefix='', dst_prefix=''):
         n_begin_rows = int(n_rows / 2)
         n_end_rows = n_rows - n_begin_rows
 
-    tab = tt.Texttable()
-    headings = ['plot id', 'k', 'tmp', 'dst', 'wall', 'phase', 'tmp',
-            'pid', 'stat', 'mem', 'user', 'sys', 'io']
+    (tab, created) = _recycled_table(('status', bool(height)))
+    headings = list(_STATUS_REPORT_HEADINGS)
     if height:
         headings.insert(0, '#')
     tab.header(headings)
-    tab.set_cols_dtype('t' * len(headings))
-    tab.set_cols_align('r' * len(headings))
-    tab.set_header_align('r' * len(headings))
+    if created:
+        tab.set_cols_dtype('t' * len(headings))
+        tab.set_cols_align('r' * len(headings))
+        tab.set_header_align('r' * len(headings))
+        tab.set_deco(0)  # No borders
 
     for i, j in enumerate(sorted(jobs, key=job.Job.get_time_wall)):
         # Elipsis row
@@ -125,7 +153,6 @@ def status_report(jobs, width, height=None, tmp_prefix='', dst_prefix=''):
         tab.add_row(row)
 
     tab.set_max_width(width)
-    tab.set_deco(0)  # No borders
 
     return tab.draw()
 
@@ -147,31 +174,34 @@ def summary(jobs, tmp_prefix=''):
 
 def tmp_dir_report(jobs, dir_cfg, sched_cfg, width, start_row=None, end_row=None, prefix=''):
     '''start_row, end_row let you split the table up if you want'''
-    tab = tt.Texttable()
-    headings = ['tmp', 'ready', 'phases']
+    (tab, created) = _recycled_table(('tmp_dir',))
+    headings = _TMP_DIR_HEADINGS
     tab.header(headings)
-    tab.set_cols_dtype('t' * len(headings))
-    tab.set_cols_align('r' * (len(headings) - 1) + 'l')
+    if created:
+        tab.set_cols_dtype('t' * len(headings))
+        tab.set_cols_align('r' * (len(headings) - 1) + 'l')
+        tab.set_deco(0)  # No borders
+    phases_by_tmpdir = job.job_phases_for_tmpdirs(dir_cfg.tmp, jobs)
     for i, d in enumerate(sorted(dir_cfg.tmp)):
         if (start_row and i < start_row) or (end_row and i >= end_row):
             continue
-        phases = sorted(job.job_phases_for_tmpdir(d, jobs))
+        phases = phases_by_tmpdir[d]
         ready = manager.phases_permit_new_job(phases, d, sched_cfg, dir_cfg)
         row = [abbr_path(d, prefix), 'OK' if ready else '--', phases_str(phases, 5)]
         tab.add_row(row)
 
     tab.set_max_width(width)
-    tab.set_deco(tt.Texttable.BORDER | tt.Texttable.HEADER )
-    tab.set_deco(0)  # No borders
     return tab.draw()
 
 def dst_dir_report(jobs, dstdirs, width, prefix=''):
-    tab = tt.Texttable()
+    (tab, created) = _recycled_table(('dst_dir',))
     dir2oldphase = manager.dstdirs_to_furthest_phase(jobs)
     dir2newphase = manager.dstdirs_to_youngest_phase(jobs)
-    headings = ['dst', 'plots', 'GBfree', 'inbnd phases', 'pri']
+    headings = _DST_DIR_HEADINGS
     tab.header(headings)
-    tab.set_cols_dtype('t' * len(headings))
+    if created:
+        tab.set_cols_dtype('t' * len(headings))
+        tab.set_deco(0)  # No borders
 
     for d in sorted(dstdirs):
         # TODO: This logic is replicated in archive.py's priority computation,
@@ -187,8 +217,6 @@ def dst_dir_report(jobs, dstdirs, width, prefix=''):
                 phases_str(phases, 5), priority]
         tab.add_row(row)
     tab.set_max_width(width)
-    tab.set_deco(tt.Texttable.BORDER | tt.Texttable.HEADER )
-    tab.set_deco(0)  # No borders
     return tab.draw()
 
 def arch_dir_report(archdir_freebytes, width, prefix=''):
@@ -198,12 +226,13 @@ def arch_dir_report(archdir_freebytes, width, prefix=''):
         return ''
 
     n_columns = int(width / (len(max(cells, key=len)) + 3))
-    tab = tt.Texttable()
+    (tab, created) = _recycled_table(('arch_dir', n_columns))
     tab.set_max_width(width)
     for row in plot_util.column_wrap(cells, n_columns, filler=''):
         tab.add_row(row)
-    tab.set_cols_align('r' * (n_columns))
-    tab.set_deco(tt.Texttable.VLINES)
+    if created:
+        tab.set_cols_align('r' * (n_columns))
+        tab.set_deco(tt.Texttable.VLINES)
     return tab.draw()
 
 # TODO: remove this